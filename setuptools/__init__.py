@@ -28,7 +28,18 @@ __all__ = [
     'find_namespace_packages',
 ]
 
-__version__ = _version_module.__version__
+if TYPE_CHECKING:
+    __version__: str
+else:
+
+    def __getattr__(name):
+        if name == "__version__":
+            return _version_module.__version__
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    def __dir__():
+        return [*globals(), "__version__"]
+
 
 bootstrap_install_from = None
 
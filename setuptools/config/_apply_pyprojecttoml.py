@@ -12,8 +12,9 @@ from __future__ import annotations
 
 import logging
 import os
+import sys
 from email.headerregistry import Address
-from functools import partial, reduce
+from functools import lru_cache
 from inspect import cleandoc
 from itertools import chain
 from types import MappingProxyType
@@ -22,6 +23,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     Mapping,
     Union,
 )
@@ -53,13 +55,8 @@ def apply(dist: Distribution, config: dict, filename: StrPath) -> Distribution:
     _apply_project_table(dist, config, root_dir)
     _apply_tool_table(dist, config, filename)
 
-    current_directory = os.getcwd()
-    os.chdir(root_dir)
-    try:
-        dist._finalize_requires()
-        dist._finalize_license_files()
-    finally:
-        os.chdir(current_directory)
+    dist._finalize_requires()
+    dist._finalize_license_files(root_dir)
 
     return dist
 
@@ -73,7 +70,7 @@ def _apply_project_table(dist: Distribution, config: dict, root_dir: StrPath):
     _unify_entry_points(project_table)
 
     for field, value in project_table.items():
-        norm_key = json_compatible_key(field)
+        norm_key = _NORMALISED_PROJECT_KEYS.get(field) or json_compatible_key(field)
         corresp = PYPROJECT_CORRESPONDENCE.get(norm_key, norm_key)
         if callable(corresp):
             corresp(dist, value, root_dir)
@@ -120,15 +117,20 @@ def json_compatible_key(key: str) -> str:
 
 
 def _set_config(dist: Distribution, field: str, value: Any):
-    setter = getattr(dist.metadata, f"set_{field}", None)
+    setter = _resolve_setter(type(dist.metadata), field)
     if setter:
-        setter(value)
+        setter(dist.metadata, value)
     elif hasattr(dist.metadata, field) or field in SETUPTOOLS_PATCHES:
         setattr(dist.metadata, field, value)
     else:
         setattr(dist, field, value)
 
 
+@lru_cache(maxsize=None)
+def _resolve_setter(metadata_cls: type, field: str) -> Callable | None:
+    return getattr(metadata_cls, f"set_{field}", None)
+
+
 _CONTENT_TYPES = {
     ".md": "text/markdown",
     ".rst": "text/x-rst",
@@ -181,22 +183,32 @@ def _license(dist: Distribution, val: dict, root_dir: StrPath):
         _set_config(dist, "license", val["text"])
 
 
-def _people(dist: Distribution, val: list[dict], _root_dir: StrPath, kind: str):
+def _authors(dist: Distribution, val: list[dict], _root_dir: StrPath):
+    _people(dist, val, "author", "author_email")
+
+
+def _maintainers(dist: Distribution, val: list[dict], _root_dir: StrPath):
+    _people(dist, val, "maintainer", "maintainer_email")
+
+
+def _people(dist: Distribution, val: list[dict], kind: str, email_kind: str):
     field = []
     email_field = []
     for person in val:
-        if "name" not in person:
-            email_field.append(person["email"])
-        elif "email" not in person:
-            field.append(person["name"])
+        name = person.get("name")
+        email = person.get("email")
+        if name is None:
+            email_field.append(email)
+        elif email is None:
+            field.append(name)
         else:
-            addr = Address(display_name=person["name"], addr_spec=person["email"])
+            addr = Address(display_name=name, addr_spec=email)
             email_field.append(str(addr))
 
     if field:
         _set_config(dist, kind, ", ".join(field))
     if email_field:
-        _set_config(dist, f"{kind}_email", ", ".join(email_field))
+        _set_config(dist, email_kind, ", ".join(email_field))
 
 
 def _project_urls(dist: Distribution, val: dict, _root_dir):
@@ -224,21 +236,28 @@ def _optional_dependencies(dist: Distribution, val: dict, _root_dir):
 def _unify_entry_points(project_table: dict):
     project = project_table
     entry_points = project.pop("entry-points", project.pop("entry_points", {}))
-    renaming = {"scripts": "console_scripts", "gui_scripts": "gui_scripts"}
-    for key, value in list(project.items()):  # eager to allow modifications
-        norm_key = json_compatible_key(key)
-        if norm_key in renaming:
+    for key, group in _ENTRY_POINTS_RENAMING.items():
+        if key in project:
             # Don't skip even if value is empty (reason: reset missing `dynamic`)
-            entry_points[renaming[norm_key]] = project.pop(key)
+            entry_points[group] = project.pop(key)
+
+    if not entry_points:
+        return
 
-    if entry_points:
-        project["entry-points"] = {
-            name: [f"{k} = {v}" for k, v in group.items()]
-            for name, group in entry_points.items()
-            if group  # now we can skip empty groups
-        }
-        # Sometimes this will set `project["entry-points"] = {}`, and that is
-        # intentional (for resetting configurations that are missing `dynamic`).
+    project["entry-points"] = {
+        name: [f"{k} = {v}" for k, v in group.items()]
+        for name, group in entry_points.items()
+        if group  # now we can skip empty groups
+    }
+    # Sometimes this will set `project["entry-points"] = {}`, and that is
+    # intentional (for resetting configurations that are missing `dynamic`).
+
+
+_ENTRY_POINTS_RENAMING = {
+    "scripts": "console_scripts",
+    "gui-scripts": "gui_scripts",
+    "gui_scripts": "gui_scripts",
+}
 
 
 def _copy_command_options(pyproject: dict, dist: Distribution, filename: StrPath):
@@ -261,22 +280,37 @@ def _copy_command_options(pyproject: dict, dist: Distribution, filename: StrPath
 
 
 def _valid_command_options(cmdclass: Mapping = EMPTY) -> dict[str, set[str]]:
-    from .._importlib import metadata
     from setuptools.dist import Distribution
 
     valid_options = {"global": _normalise_cmd_options(Distribution.global_options)}
 
-    unloaded_entry_points = metadata.entry_points(group='distutils.commands')
-    loaded_entry_points = (_load_ep(ep) for ep in unloaded_entry_points)
-    entry_points = (ep for ep in loaded_entry_points if ep)
-    for cmd, cmd_class in chain(entry_points, cmdclass.items()):
-        opts = valid_options.get(cmd, set())
-        opts = opts | _normalise_cmd_options(getattr(cmd_class, "user_options", []))
-        valid_options[cmd] = opts
+    entry_points = _entry_points_command_options(tuple(sys.path))
+    cmdclass_options = (
+        (cmd, _normalise_cmd_options(getattr(cmd_class, "user_options", [])))
+        for cmd, cmd_class in cmdclass.items()
+    )
+    for cmd, opts in chain(entry_points, cmdclass_options):
+        valid_options[cmd] = valid_options.get(cmd, set()) | opts
 
     return valid_options
 
 
+@lru_cache(maxsize=8)
+def _entry_points_command_options(
+    _sys_path: tuple[str, ...],
+) -> tuple[tuple[str, frozenset[str]], ...]:
+    # Loading ``distutils.commands`` entry-points is expensive, so the result is
+    # reused while ``sys.path`` (i.e. the set of visible distributions) is the same
+    from .._importlib import metadata
+
+    unloaded_entry_points = metadata.entry_points(group='distutils.commands')
+    loaded_entry_points = (_load_ep(ep) for ep in unloaded_entry_points)
+    return tuple(
+        (cmd, frozenset(_normalise_cmd_options(getattr(cmd_class, "user_options", []))))
+        for cmd, cmd_class in filter(None, loaded_entry_points)
+    )
+
+
 def _load_ep(ep: metadata.EntryPoint) -> tuple[str, type] | None:
     # Ignore all the errors
     try:
@@ -323,7 +357,14 @@ def _attrgetter(attr):
     >>> _attrgetter("d")(obj) is None
     True
     """
-    return partial(reduce, lambda acc, x: getattr(acc, x, None), attr.split("."))
+    names = attr.split(".")
+
+    def _getter(obj):
+        for name in names:
+            obj = getattr(obj, name, None)
+        return obj
+
+    return _getter
 
 
 def _some_attrgetter(*items):
@@ -349,8 +390,8 @@ def _some_attrgetter(*items):
 PYPROJECT_CORRESPONDENCE: dict[str, _Correspondence] = {
     "readme": _long_description,
     "license": _license,
-    "authors": partial(_people, kind="author"),
-    "maintainers": partial(_people, kind="maintainer"),
+    "authors": _authors,
+    "maintainers": _maintainers,
     "urls": _project_urls,
     "dependencies": _dependencies,
     "optional_dependencies": _optional_dependencies,
@@ -393,6 +434,19 @@ _PREVIOUSLY_DEFINED = {
 }
 
 
+def _normalised_keys(fields: Iterable[str]) -> dict[str, str]:
+    """Map the known spellings of ``fields`` to their JSON compatible keys"""
+    keys = {}
+    for field in fields:
+        norm_key = json_compatible_key(field)
+        keys[field] = keys[norm_key] = norm_key
+    return keys
+
+
+# Avoid normalising the keys that are known in advance
+_NORMALISED_PROJECT_KEYS = _normalised_keys([*_PREVIOUSLY_DEFINED, "dynamic"])
+
+
 _RESET_PREVIOUSLY_DEFINED: dict = {
     # Fix improper setting: given in `setup.py`, but not listed in `dynamic`
     # dict: pyproject name => value to which reset
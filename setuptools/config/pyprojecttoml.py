@@ -11,10 +11,11 @@ with the help of ``tomllib`` or ``tomli``.
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 from contextlib import contextmanager
-from functools import partial
+from functools import lru_cache, partial
 from typing import TYPE_CHECKING, Callable, Mapping
 
 from .._path import StrPath
@@ -47,7 +48,7 @@ def validate(config: dict, filepath: StrPath) -> bool:
         trove_classifier._disable_download()  # type: ignore
 
     try:
-        return validator.validate(config)
+        return _validate_maybe_cached(config)
     except validator.ValidationError as ex:
         summary = f"configuration error: {ex.summary}"
         if ex.name.strip("`") != "project":
@@ -59,6 +60,37 @@ def validate(config: dict, filepath: StrPath) -> bool:
         raise ValueError(f"{error}\n{summary}") from None
 
 
+_MAX_CACHED_PAYLOAD = 64 * 1024  # Avoid keeping huge configs alive in the cache
+
+
+def _validate_maybe_cached(config: dict) -> bool:
+    """Reuse previous successful validations of configs made of plain JSON types.
+    This is only safe after the download of trove classifiers is disabled
+    (see :func:`validate`), otherwise the result could depend on the network.
+    """
+    from . import _validate_pyproject as validator
+
+    try:
+        # Other types (e.g. TOML datetimes) could change in a JSON round-trip
+        payload = json.dumps(config, sort_keys=True)
+    except (TypeError, ValueError):
+        return validator.validate(config)
+
+    if len(payload) > _MAX_CACHED_PAYLOAD:
+        return validator.validate(config)
+
+    # The result also depends on the (mutable) registry of format functions
+    formats = tuple(validator.FORMAT_FUNCTIONS.items())
+    return _validate_cached(payload, formats)
+
+
+@lru_cache(maxsize=32)
+def _validate_cached(payload: str, _formats: tuple) -> bool:
+    from . import _validate_pyproject as validator
+
+    return validator.validate(json.loads(payload))
+
+
 def apply_configuration(
     dist: Distribution,
     filepath: StrPath,
@@ -7,7 +7,7 @@ import os
 import re
 import sys
 from contextlib import suppress
-from glob import iglob
+from glob import escape, iglob
 from pathlib import Path
 from typing import TYPE_CHECKING, MutableMapping
 
@@ -32,6 +32,7 @@ from . import _normalization
 from . import _reqs
 from . import command as _  # noqa  -- imported for side-effects
 from ._importlib import metadata
+from ._path import StrPath
 from .config import setupcfg, pyprojecttoml
 from .discovery import ConfigDiscovery
 from .monkey import get_unpatched
@@ -209,6 +210,14 @@ else:
     _Distribution = get_unpatched(distutils.core.Distribution)
 
 
+def _iglob_relative(pattern: str, root_dir: StrPath | None):
+    """Similar to ``glob.iglob(pattern, root_dir=root_dir)`` (Python 3.10+)"""
+    if root_dir is None or os.path.isabs(pattern):
+        return iglob(pattern)
+    matches = iglob(os.path.join(escape(os.fspath(root_dir)), pattern))
+    return (os.path.relpath(path, root_dir) for path in matches)
+
+
 class Distribution(_Distribution):
     """Distribution with support for tests and package data
 
@@ -387,8 +396,11 @@ class Distribution(_Distribution):
             k: list(map(str, _reqs.parse(v or []))) for k, v in extras_require.items()
         }
 
-    def _finalize_license_files(self) -> None:
-        """Compute names of all license files which should be included."""
+    def _finalize_license_files(self, root_dir: StrPath | None = None) -> None:
+        """Compute names of all license files which should be included.
+
+        Patterns are expanded relative to ``root_dir`` (or the current directory).
+        """
         license_files: list[str] | None = self.metadata.license_files
         patterns: list[str] = license_files if license_files else []
 
@@ -403,22 +415,23 @@ class Distribution(_Distribution):
             patterns = ['LICEN[CS]E*', 'COPYING*', 'NOTICE*', 'AUTHORS*']
 
         self.metadata.license_files = list(
-            unique_everseen(self._expand_patterns(patterns))
+            unique_everseen(self._expand_patterns(patterns, root_dir))
         )
 
     @staticmethod
-    def _expand_patterns(patterns):
+    def _expand_patterns(patterns, root_dir: StrPath | None = None):
         """
         >>> list(Distribution._expand_patterns(['LICENSE']))
         ['LICENSE']
         >>> list(Distribution._expand_patterns(['pyproject.toml', 'LIC*']))
         ['pyproject.toml', 'LICENSE']
         """
+        root = root_dir or os.curdir
         return (
             path
             for pattern in patterns
-            for path in sorted(iglob(pattern))
-            if not path.endswith('~') and os.path.isfile(path)
+            for path in sorted(_iglob_relative(pattern, root_dir))
+            if not path.endswith('~') and os.path.isfile(os.path.join(root, path))
         )
 
     # FIXME: 'Distribution._parse_config_files' is too complex (14)
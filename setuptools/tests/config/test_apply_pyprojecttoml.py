@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import io
 import re
+import sys
 import tarfile
 from inspect import cleandoc
 from pathlib import Path
@@ -23,7 +24,12 @@ import setuptools  # noqa ensure monkey patch to metadata
 from setuptools.dist import Distribution
 from setuptools.config import setupcfg, pyprojecttoml
 from setuptools.config import expand
-from setuptools.config._apply_pyprojecttoml import _MissingDynamic, _some_attrgetter
+from setuptools.config._apply_pyprojecttoml import (
+    _entry_points_command_options,
+    _MissingDynamic,
+    _some_attrgetter,
+    _valid_command_options,
+)
 from setuptools.command.egg_info import write_requirements
 from setuptools.errors import RemovedConfigError
 
@@ -307,6 +313,24 @@ class TestLicenseFiles:
         assert (tmp_path / "LICENSE.txt").exists()  # from base example
         assert set(dist.metadata.license_files) == {*license_files, "LICENSE.txt"}
 
+    def test_cwd_different_from_project_dir(self, tmp_path, monkeypatch):
+        project_dir = tmp_path / "proj"
+        project_dir.mkdir()
+        (project_dir / "sub").mkdir()
+        (project_dir / "sub/a.txt").write_text("a", encoding="utf-8")
+        (tmp_path / "LICENSE-outside").write_text("x", encoding="utf-8")
+        abs_pattern = (project_dir / "sub/*.txt").as_posix()
+        patterns = f'["LIC*", "{abs_pattern}"]'
+        setuptools_config = f"[tool.setuptools]\nlicense-files = {patterns}"
+        pyproject = self.base_pyproject(project_dir, setuptools_config)
+
+        monkeypatch.chdir(tmp_path)
+        dist = pyprojecttoml.apply_configuration(makedist(project_dir), pyproject)
+        assert Path.cwd() == tmp_path
+        # Relative patterns are resolved against the project dir, absolute are kept
+        expected = [Path("LICENSE.txt"), project_dir / "sub" / "a.txt"]
+        assert [Path(p) for p in dist.metadata.license_files] == expected
+
 
 class TestDeprecatedFields:
     def test_namespace_packages(self, tmp_path):
@@ -416,6 +440,52 @@ class TestPresetField:
         assert group in dist.entry_points
 
 
+class TestValidCommandOptions:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        _entry_points_command_options.cache_clear()
+        yield
+        _entry_points_command_options.cache_clear()
+
+    def test_entry_points_are_cached(self):
+        first = _valid_command_options()
+        assert "sdist" in first
+        assert _entry_points_command_options.cache_info().misses == 1
+
+        first["sdist"].add("not-an-option")  # callers should not share results
+        second = _valid_command_options()
+        assert _entry_points_command_options.cache_info().hits == 1
+        assert "not-an-option" not in second["sdist"]
+
+    def test_sys_path_changes_invalidate_cache(self, tmp_path, monkeypatch):
+        assert "mycmd" not in _valid_command_options()
+
+        dist_info = tmp_path / "myplugin-0.1.dist-info"
+        dist_info.mkdir()
+        metadata = "Metadata-Version: 2.1\nName: myplugin\nVersion: 0.1\n"
+        (dist_info / "METADATA").write_text(metadata, encoding="utf-8")
+        entry_points = "[distutils.commands]\nmycmd = myplugin_cmd:MyCmd\n"
+        (dist_info / "entry_points.txt").write_text(entry_points, encoding="utf-8")
+        module = "class MyCmd:\n    user_options = [('my-opt=', None, '')]\n"
+        (tmp_path / "myplugin_cmd.py").write_text(module, encoding="utf-8")
+        monkeypatch.syspath_prepend(tmp_path)
+
+        try:
+            assert _valid_command_options()["mycmd"] == {"my_opt"}
+        finally:
+            # Loading the entry-point imports the module, avoid leaking it
+            sys.modules.pop("myplugin_cmd", None)
+
+    def test_cmdclass(self):
+        class MyCmd:
+            user_options = [("my-opt=", None, "")]
+
+        valid = _valid_command_options({"mycmd": MyCmd, "sdist": MyCmd})
+        assert valid["mycmd"] == {"my_opt"}
+        assert "my_opt" in valid["sdist"]
+        assert "my_opt" not in _valid_command_options()["sdist"]
+
+
 class TestMeta:
     def test_example_file_in_sdist(self, setuptools_sdist):
         """Meta test to ensure tests can run from sdist"""
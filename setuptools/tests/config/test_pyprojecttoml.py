@@ -1,5 +1,7 @@
+import copy
 import re
 from configparser import ConfigParser
+from datetime import datetime
 from inspect import cleandoc
 
 import jaraco.path
@@ -9,6 +11,7 @@ from path import Path
 
 from setuptools.config.pyprojecttoml import (
     _ToolsTypoInMetadata,
+    _validate_cached,
     read_configuration,
     expand_configuration,
     apply_configuration,
@@ -331,6 +334,53 @@ def test_invalid_example(tmp_path, example, error_msg):
         read_configuration(pyproject)
 
 
+class TestValidationCache:
+    @pytest.fixture
+    def config(self):
+        return {"project": {"name": "myproj", "version": "42", "dynamic": []}}
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        _validate_cached.cache_clear()
+        yield
+        _validate_cached.cache_clear()
+
+    def test_repeated_validation_hits_cache(self, tmp_path, config):
+        assert validate(config, tmp_path / "pyproject.toml")
+        assert _validate_cached.cache_info().misses == 1
+        assert validate(copy.deepcopy(config), tmp_path / "pyproject.toml")
+        assert _validate_cached.cache_info().hits == 1
+
+    def test_errors_are_not_cached(self, tmp_path):
+        invalid = {"project": {"name": "myproj", "version": "42", "dynamic": ["name"]}}
+        for _ in range(2):
+            with pytest.raises(ValueError, match="invalid pyproject.toml"):
+                validate(invalid, tmp_path / "pyproject.toml")
+        assert _validate_cached.cache_info().hits == 0
+
+    def test_non_json_values_skip_cache(self, tmp_path, config):
+        config["tool"] = {"other": {"date": datetime(2024, 1, 1)}}
+        assert validate(config, tmp_path / "pyproject.toml")
+        assert validate(config, tmp_path / "pyproject.toml")
+        assert _validate_cached.cache_info().currsize == 0
+
+    def test_big_payloads_skip_cache(self, tmp_path, config):
+        config["project"]["description"] = "x" * 70_000
+        assert validate(config, tmp_path / "pyproject.toml")
+        assert _validate_cached.cache_info().currsize == 0
+
+    def test_format_functions_are_part_of_key(self, tmp_path, monkeypatch, config):
+        from setuptools.config import _validate_pyproject as validator
+
+        def reject(_value):
+            return False
+
+        assert validate(config, tmp_path / "pyproject.toml")
+        monkeypatch.setitem(validator.FORMAT_FUNCTIONS, "pep508-identifier", reject)
+        with pytest.raises(ValueError, match="invalid pyproject.toml"):
+            validate(config, tmp_path / "pyproject.toml")
+
+
 @pytest.mark.parametrize("config", ("", "[tool.something]\nvalue = 42"))
 def test_empty(tmp_path, config):
     pyproject = tmp_path / "pyproject.toml"
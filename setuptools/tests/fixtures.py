@@ -2,6 +2,7 @@ import os
 import contextlib
 import sys
 import subprocess
+import tarfile
 from pathlib import Path
 
 import pytest
@@ -47,11 +48,33 @@ def workaround_xdist_376(request):
         sys.path.remove('')
 
 
+SAMPLE_PROJECT_TARBALL = Path(__file__).with_name("_sampleproject.tar.gz")
+
+
 @pytest.fixture
 def sample_project(tmp_path):
     """
-    Clone the 'sampleproject' and return a path to it.
+    Extract (or clone, if the tarball is missing) the 'sampleproject'
+    and return a path to it.
+
+    The tarball contains the sdist of ``sampleproject==3.0.0`` from PyPI (the last
+    release supporting Python 3.8), without ``PKG-INFO`` and ``*.egg-info``,
+    repackaged under a top-level ``sampleproject/`` directory. To regenerate it::
+
+        pip download --no-deps --no-binary :all: sampleproject==3.0.0
+        tar xzf sampleproject-3.0.0.tar.gz
+        mv sampleproject-3.0.0 sampleproject
+        rm -r sampleproject/PKG-INFO sampleproject/src/*.egg-info
+        tar czf setuptools/tests/_sampleproject.tar.gz sampleproject
     """
+    if SAMPLE_PROJECT_TARBALL.exists():
+        with tarfile.open(SAMPLE_PROJECT_TARBALL) as tf:
+            if hasattr(tarfile, "data_filter"):
+                tf.extractall(tmp_path, filter="data")
+            else:  # pragma: no cover
+                tf.extractall(tmp_path)
+        return tmp_path / 'sampleproject'
+
     cmd = ['git', 'clone', 'https://github.com/pypa/sampleproject']
     try:
         subprocess.check_call(cmd, cwd=str(tmp_path))
@@ -2,6 +2,7 @@ import functools
 import io
 import importlib
 from email import message_from_string
+from types import MappingProxyType
 
 import pytest
 
@@ -13,14 +14,16 @@ from setuptools._core_metadata import rfc822_escape, rfc822_unescape
 from setuptools.command.egg_info import egg_info, write_requirements
 
 
-EXAMPLE_BASE_INFO = dict(
-    name="package",
-    version="0.0.1",
-    author="Foo Bar",
-    author_email="foo@bar.net",
-    long_description="Long\ndescription",
-    description="Short description",
-    keywords=["one", "two"],
+EXAMPLE_BASE_INFO = MappingProxyType(
+    dict(
+        name="package",
+        version="0.0.1",
+        author="Foo Bar",
+        author_email="foo@bar.net",
+        long_description="Long\ndescription",
+        description="Short description",
+        keywords=["one", "two"],
+    )
 )
 
 
@@ -201,10 +204,7 @@ def __maintainer_test_cases():
     attrs = {"name": "package", "version": "1.0", "description": "xxx"}
 
     def merge_dicts(d1, d2):
-        d1 = d1.copy()
-        d1.update(d2)
-
-        return d1
+        return {**d1, **d2}
 
     return [
         ('No author, no maintainer', attrs.copy()),
@@ -295,11 +295,12 @@ def test_maintainer_author(name, attrs, tmpdir):
     # Duplicate lines should not be generated
     assert len(pkg_lines) == len(pkg_lines_set)
 
+    pkg_fields = {line.split(':', 1)[0] for line in pkg_lines}
+
     for fkey, dkey in tested_keys.items():
         val = attrs.get(dkey, None)
         if val is None:
-            for line in pkg_lines:
-                assert not line.startswith(fkey + ':')
+            assert fkey not in pkg_fields
         else:
             line = '%s: %s' % (fkey, val)
             assert line in pkg_lines_set
@@ -307,3 +307,11 @@ def test_its_own_wheel_does_not_contain_tests(setuptools_wheel):
 
     for member in contents:
         assert '/tests/' not in member
+
+
+def test_version_is_listed_in_dir():
+    import setuptools.version
+
+    assert "__version__" in dir(setuptools)
+    assert "__version__" in dir(setuptools.version)
+    assert setuptools.__version__ == setuptools.version.__version__
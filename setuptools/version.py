@@ -1,6 +1,21 @@
-from ._importlib import metadata
+from __future__ import annotations
 
-try:
-    __version__ = metadata.version('setuptools') or '0.dev0+unknown'
-except Exception:
-    __version__ = '0.dev0+unknown'
+
+def __getattr__(name: str) -> str:
+    # Resolving the version scans ``sys.path``, so it is deferred until needed
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from ._importlib import metadata
+
+    try:
+        version = metadata.version('setuptools') or '0.dev0+unknown'
+    except Exception:
+        version = '0.dev0+unknown'
+
+    globals()["__version__"] = version
+    return version
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), "__version__"})